@@ -1,10 +1,149 @@
 Here's the Python code implementing the two user stories, adhering to the Gherkin acceptance criteria.
 
-This solution simulates the backend logic of a hospital patient registration system. It uses in-memory dictionaries to store patient data and generates unique IDs. The functions return dictionaries indicating `status` (success/error), `message`, and relevant `data` (like patient IDs, error details, or retained form data), mimicking an API response that a frontend application would consume.
+This solution simulates the backend logic of a hospital patient registration system. It keeps patient and emergency contact records as lightweight slotted dataclasses in memory and generates unique IDs. The functions return dictionaries indicating `status` (success/error), `message`, and relevant `data` (like patient IDs, error details, or retained form data), mimicking an API response that a frontend application would consume.
 
 ```python
+import collections.abc
+import dataclasses
 import datetime
-import uuid
+import functools
+import json
+import math
+import re
+import secrets
+import sys
+import time
+
+# --- Validation Constants ---
+_PATIENT_REQUIRED_FIELDS = (
+    ("first_name", "First Name"),
+    ("last_name", "Last Name"),
+    ("date_of_birth", "Date of Birth"),
+    ("gender", "Gender"),
+    ("phone_number", "Phone Number"),
+    ("address_line_1", "Address Line 1"),
+    ("city", "City"),
+    ("state", "State"),
+    ("zip_code", "Zip Code"),
+    ("admission_date", "Admission Date"),
+    ("chief_complaint", "Chief Complaint"),
+)
+_CONTACT_REQUIRED_FIELDS = (
+    ("contact_name", "Contact Name"),
+    ("relationship", "Relationship"),
+    ("phone_number", "Phone Number"),
+)
+_PATIENT_FIELDS = tuple(field for field, _ in _PATIENT_REQUIRED_FIELDS)
+_CONTACT_FIELDS = tuple(field for field, _ in _CONTACT_REQUIRED_FIELDS)
+_CONTACT_FORM_FIELDS = _CONTACT_FIELDS + ("email_address",)
+_DATE_FIELDS = (("date_of_birth", "Date of Birth"), ("admission_date", "Admission Date"))
+_VALID_GENDERS = frozenset({"male", "female", "other", "prefer not to say"})
+_GENDER_OPTIONS = frozenset({"Male", "Female", "Other", "Prefer not to say"})  # As offered in the form
+_PATIENT_MISSING_MSG = {field: f"{display} is required" for field, display in _PATIENT_REQUIRED_FIELDS}
+_CONTACT_MISSING_MSG = {field: f"{display} is required" for field, display in _CONTACT_REQUIRED_FIELDS}
+_DATE_FORMAT_MSG = {field: f"{display} must be in YYYY-MM-DD format" for field, display in _DATE_FIELDS}
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_DATE_RE = re.compile(r"(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])")
+
+# --- Helper for validating YYYY-MM-DD dates ---
+def _is_valid_date(date_str: str) -> bool:
+    """
+    Checks that a string is a real calendar date in YYYY-MM-DD format.
+    The regex rejects malformed input without raising; date() only runs
+    on well-formed strings to catch impossible days such as February 30th.
+    """
+    match = _DATE_RE.fullmatch(date_str)
+    if match is None:
+        return False
+    try:
+        datetime.date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        return False
+    return True
+
+# --- Helpers for normalizing submitted form values ---
+def _form_value(value) -> str:
+    """
+    Converts a submitted value to plain str before validation, so validators, stored records
+    and error echoes all see the same JSON-primitive value (e.g. a datetime.date becomes
+    "YYYY-MM-DD"). Missing values (None, or the NaN pandas fills blank cells with) become "".
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value)
+
+def _patient_form(details: dict) -> dict:
+    """Normalized copy of the patient fields of a submission; other keys are dropped."""
+    return {k: _form_value(details.get(k)) for k in _PATIENT_FIELDS}
+
+def _contact_form(details: dict) -> dict:
+    """Normalized copy of the emergency contact fields of a submission; other keys are dropped."""
+    return {k: _form_value(details.get(k)) for k in _CONTACT_FORM_FIELDS}
+
+# --- Helper for interning low-cardinality field values ---
+def _interned(value) -> str:
+    """
+    Returns the shared interned copy of a value as a plain str.
+    sys.intern rejects str subclasses such as numpy.str_, so the value is coerced first.
+    """
+    return sys.intern(str(value))
+
+# --- Record Types ---
+@dataclasses.dataclass(slots=True)
+class EmergencyContact:
+    """An emergency contact associated with a registered patient."""
+    contact_id: str
+    patient_id: str
+    contact_name: str
+    relationship: str
+    phone_number: str
+    email_address: str = ""  # Optional field
+
+    def to_dict(self) -> dict:
+        """Plain-dict view of the contact for API responses."""
+        return {
+            "contact_id": self.contact_id,
+            "patient_id": self.patient_id,
+            "contact_name": self.contact_name,
+            "relationship": self.relationship,
+            "phone_number": self.phone_number,
+            "email_address": self.email_address,
+        }
+
+@dataclasses.dataclass(slots=True)
+class Patient:
+    """A registered patient's demographic, admission and emergency contact record."""
+    patient_id: str
+    first_name: str
+    last_name: str
+    date_of_birth: str
+    gender: str
+    phone_number: str
+    address_line_1: str
+    city: str
+    state: str
+    zip_code: str
+    admission_date: str
+    chief_complaint: str
+    emergency_contacts: list = dataclasses.field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Plain-dict view of the patient, contacts included, for API responses."""
+        return {
+            "patient_id": self.patient_id,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "date_of_birth": self.date_of_birth,
+            "gender": self.gender,
+            "phone_number": self.phone_number,
+            "address_line_1": self.address_line_1,
+            "city": self.city,
+            "state": self.state,
+            "zip_code": self.zip_code,
+            "admission_date": self.admission_date,
+            "chief_complaint": self.chief_complaint,
+            "emergency_contacts": [contact.to_dict() for contact in self.emergency_contacts],
+        }
 
 # --- Helper for generating unique Patient IDs ---
 class PatientIdGenerator:
@@ -15,15 +154,48 @@ class PatientIdGenerator:
     def __init__(self):
         self._counter = 0
         self._last_year = datetime.date.today().year
+        self._year_epoch_end = self._next_year_epoch(self._last_year)
+
+    @staticmethod
+    def _next_year_epoch(year: int) -> float:
+        """Unix timestamp of local midnight on January 1st of the following year."""
+        return time.mktime((year + 1, 1, 1, 0, 0, 0, 0, 0, -1))
 
     def generate_id(self):
-        current_year = datetime.date.today().year
-        if current_year != self._last_year:
+        # A float compare replaces building a date object on every call;
+        # the year is only recomputed once the cached boundary has passed.
+        if time.time() >= self._year_epoch_end:
             self._counter = 0  # Reset counter for a new year
-            self._last_year = current_year
+            self._last_year = datetime.date.today().year
+            self._year_epoch_end = self._next_year_epoch(self._last_year)
 
         self._counter += 1
-        return f"P-{current_year}-{self._counter:04d}"
+        return f"P-{self._last_year}-{self._counter:04d}"
+
+# --- Read-only Patient Mapping ---
+class _PatientMapping(collections.abc.Mapping):
+    """
+    Live, read-only patient_id -> Patient mapping over a registry's storage.
+    Lookups and membership checks are a single dict probe; iteration walks the ID list.
+    """
+    __slots__ = ("_ids", "_records", "_id_to_idx")
+
+    def __init__(self, ids: list, records: list, id_to_idx: dict):
+        self._ids = ids
+        self._records = records
+        self._id_to_idx = id_to_idx
+
+    def __getitem__(self, patient_id: str) -> Patient:
+        return self._records[self._id_to_idx[patient_id]]
+
+    def __contains__(self, patient_id) -> bool:
+        return patient_id in self._id_to_idx
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
 
 # --- HospitalRegistry System Class ---
 class HospitalRegistry:
@@ -32,8 +204,24 @@ class HospitalRegistry:
     Simulates a backend service with in-memory storage.
     """
     def __init__(self):
-        self.patients = {}  # Stores patient records, keyed by patient_id
+        # Patient records are kept in registration order in parallel lists, so
+        # bulk scans walk contiguous storage; _id_to_idx maps patient_id to a position.
+        self._patient_ids: list[str] = []
+        self._patient_records: list[Patient] = []
+        self._id_to_idx: dict[str, int] = {}
+        self._patients_view = _PatientMapping(self._patient_ids, self._patient_records, self._id_to_idx)
         self._id_generator = PatientIdGenerator()
+        # Serialized patient views are cached per (patient_id, contact count). Contacts are the
+        # only part of a record that changes after registration, so a new count means a new entry.
+        self._cached_view = functools.lru_cache(maxsize=4096)(self._render_patient_view)
+
+    @property
+    def patients(self) -> collections.abc.Mapping:
+        """
+        Live, read-only mapping of all patient records keyed by patient_id, in registration order.
+        Lookups and membership checks are O(1); new registrations show up immediately.
+        """
+        return self._patients_view
 
     # --- Private Helper: Validate Patient Registration Details ---
     def _validate_patient_details(self, details: dict) -> dict:
@@ -42,37 +230,24 @@ class HospitalRegistry:
         Returns a dictionary of errors, or an empty dictionary if valid.
         """
         errors = {}
-        required_fields = {
-            "first_name": "First Name",
-            "last_name": "Last Name",
-            "date_of_birth": "Date of Birth",
-            "gender": "Gender",
-            "phone_number": "Phone Number",
-            "address_line_1": "Address Line 1",
-            "city": "City",
-            "state": "State",
-            "zip_code": "Zip Code",
-            "admission_date": "Admission Date",
-            "chief_complaint": "Chief Complaint"
-        }
-
-        for field, display_name in required_fields.items():
-            if not details.get(field):
-                errors[field] = f"{display_name} is required"
+        get = details.get  # Bound once; looked up for every field below
+        # Only required keys are checked, so extra submitted keys are never inspected
+        for field, message in _PATIENT_MISSING_MSG.items():
+            if not get(field):
+                errors[field] = message
 
         # Specific date format validation (YYYY-MM-DD)
-        date_fields = {"date_of_birth": "Date of Birth", "admission_date": "Admission Date"}
-        for field, display_name in date_fields.items():
-            date_str = details.get(field)
+        for field, message in _DATE_FORMAT_MSG.items():
+            date_str = get(field)
             if date_str and field not in errors: # Only validate format if field is present and not already marked as missing
-                try:
-                    datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                except ValueError:
-                    errors[field] = f"{display_name} must be in YYYY-MM-DD format"
+                if not _is_valid_date(date_str):
+                    errors[field] = message
         
         # Simple gender validation (if provided)
-        gender = details.get("gender")
-        if gender and gender.lower() not in ["male", "female", "other", "prefer not to say"] and "gender" not in errors:
+        gender = get("gender")
+        # Form values match the option casing exactly, so .lower() only runs for free-typed input;
+        # a truthy gender can never already be in errors as missing
+        if gender and gender not in _GENDER_OPTIONS and gender.lower() not in _VALID_GENDERS:
             errors["gender"] = "Invalid gender. Must be Male, Female, Other, or Prefer not to say."
 
         return errors
@@ -81,46 +256,77 @@ class HospitalRegistry:
     def register_new_patient(self, details: dict) -> dict:
         """
         Registers a new patient with their essential demographic and contact information.
+        Field values are converted to plain str before validation (see _form_value), so records
+        and responses, error echoes included, contain only JSON-primitive types and serialize
+        without a custom encoder.
         Returns a dictionary with status, message, and either patient_id/patient_data or errors.
         """
-        validation_errors = self._validate_patient_details(details)
+        form = _patient_form(details)
+        validation_errors = self._validate_patient_details(form)
 
         if validation_errors:
-            return {
-                "status": "error",
-                "message": "Failed to register patient due to missing or invalid information.",
-                "errors": validation_errors,
-                "data": details # Return the original data for form re-population
-            }
+            return self._registration_error(form, validation_errors)
+        return self._store_patient(form)
 
-        patient_id = self._id_generator.generate_id()
-        new_patient = {
-            "patient_id": patient_id,
-            "first_name": details["first_name"],
-            "last_name": details["last_name"],
-            "date_of_birth": details["date_of_birth"],
-            "gender": details["gender"],
-            "phone_number": details["phone_number"],
-            "address_line_1": details["address_line_1"],
-            "city": details["city"],
-            "state": details["state"],
-            "zip_code": details["zip_code"],
-            "admission_date": details["admission_date"],
-            "chief_complaint": details["chief_complaint"],
-            "emergency_contacts": [] # Initialize with an empty list for contacts
+    # --- Private Helper: Registration Error Response ---
+    @staticmethod
+    def _registration_error(form: dict, validation_errors: dict) -> dict:
+        """Builds the error response for a normalized registration form that failed validation."""
+        return {
+            "status": "error",
+            "message": "Failed to register patient due to missing or invalid information.",
+            "errors": validation_errors,
+            "data": form # For form re-population; blank if not entered
         }
 
-        self.patients[patient_id] = new_patient
-        full_name = f"{new_patient['first_name']} {new_patient['last_name']}"
+    # --- Private Helper: Store a Validated Patient ---
+    def _store_patient(self, form: dict) -> dict:
+        """Assigns an ID to a validated, normalized form, stores the record and builds the success response."""
+        patient_id = self._id_generator.generate_id()
+        record = dict(form)
+        # Low-cardinality fields share one string object across all patients
+        record["gender"] = _interned(record["gender"])
+        record["state"] = _interned(record["state"])
+        new_patient = Patient(patient_id=patient_id, **record)
+
+        self._id_to_idx[patient_id] = len(self._patient_records)
+        self._patient_records.append(new_patient)
+        self._patient_ids.append(patient_id)
+        full_name = f"{form['first_name']} {form['last_name']}"
 
         return {
             "status": "success",
             "message": f"Patient {full_name} registered successfully with ID {patient_id}",
             "patient_id": patient_id,
-            "patient_data": new_patient,
+            "patient_data": new_patient.to_dict(),
             "clear_form": True # Signal for UI to clear fields
         }
 
+    # --- Bulk Import: Register Many Patients at Once ---
+    def register_batch(self, columns: dict) -> list:
+        """
+        Registers patients from column-oriented data (e.g. a parsed CSV or
+        DataFrame.to_dict("list")), mapping each field name to a sequence of values.
+        Only patient field columns are read; missing columns and missing cells (None or NaN)
+        are treated as blank, and any other columns (e.g. "notes") are ignored.
+        Every row is validated before any is stored, so an exception leaves the registry unchanged.
+        Returns one response per row, in input order, with the same shape as register_new_patient.
+        Raises ValueError if the patient field columns differ in length.
+        """
+        lengths = {len(columns[field]) for field in _PATIENT_FIELDS if field in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Patient field columns must all have the same length, got lengths {sorted(lengths)}.")
+        row_count = lengths.pop() if lengths else 0
+
+        blank_column = ("",) * row_count
+        field_columns = [columns[field] if field in columns else blank_column for field in _PATIENT_FIELDS]
+        rows = [dict(zip(_PATIENT_FIELDS, map(_form_value, row))) for row in zip(*field_columns)]
+
+        validate = self._validate_patient_details  # Resolve the bound methods once for the loops
+        checked = [(row, validate(row)) for row in rows]
+        store, error = self._store_patient, self._registration_error
+        return [error(row, errors) if errors else store(row) for row, errors in checked]
+
     # --- Private Helper: Validate Emergency Contact Details ---
     def _validate_emergency_contact_details(self, details: dict) -> dict:
         """
@@ -128,73 +334,152 @@ class HospitalRegistry:
         Returns a dictionary of errors, or an empty dictionary if valid.
         """
         errors = {}
-        required_fields = {
-            "contact_name": "Contact Name",
-            "relationship": "Relationship",
-            "phone_number": "Phone Number"
-        }
-
-        for field, display_name in required_fields.items():
-            if not details.get(field):
-                errors[field] = f"{display_name} is required"
+        get = details.get
+        for field, message in _CONTACT_MISSING_MSG.items():
+            if not get(field):
+                errors[field] = message
         
         # Basic email format validation (optional field, so only if provided)
-        email = details.get("email_address")
-        if email and "@" not in email and "email_address" not in errors:
+        email = get("email_address")
+        if email and not _EMAIL_RE.fullmatch(email) and "email_address" not in errors:
             errors["email_address"] = "Invalid email address format"
 
         return errors
 
+    # --- Private Helper: Build a Validated Emergency Contact Record ---
+    @staticmethod
+    def _build_contact(patient_id: str, form: dict) -> EmergencyContact:
+        """Creates the stored contact record from a validated, normalized contact form."""
+        record = dict(form)  # email_address is "" when not provided (optional field)
+        record["relationship"] = _interned(record["relationship"])
+        return EmergencyContact(
+            contact_id=secrets.token_hex(16), # Unique opaque ID for the contact itself
+            patient_id=patient_id,
+            **record
+        )
+
     # --- User Story 2: Add Patient Emergency Contact ---
     def add_emergency_contact(self, patient_id: str, contact_details: dict) -> dict:
         """
         Records emergency contact information for a registered patient.
-        Returns a dictionary with status, message, and either updated patient data or errors.
+        Values are normalized to plain str before validation, as in register_new_patient.
+        Returns a dictionary with status, message, and either the new contact or errors.
+        The patient's full contact list is not echoed back, so adds stay O(1) however many
+        contacts a patient has; use get_patient or get_patient_view to fetch it.
         """
-        if patient_id not in self.patients:
+        form = _contact_form(contact_details)
+        patient = self.get_patient(patient_id)
+        if patient is None:
             return {
                 "status": "error",
                 "message": f"Patient with ID {patient_id} not found. Cannot add emergency contact.",
                 "errors": {"patient_id": "Patient not found"},
-                "data": contact_details
+                "data": form
             }
 
-        validation_errors = self._validate_emergency_contact_details(contact_details)
+        validation_errors = self._validate_emergency_contact_details(form)
 
         if validation_errors:
             return {
                 "status": "error",
                 "message": "Failed to add emergency contact due to missing or invalid information.",
                 "errors": validation_errors,
-                "data": contact_details # Return the original data for form re-population
+                "data": form # For form re-population
             }
 
-        patient = self.patients[patient_id]
-        new_contact = {
-            "contact_id": str(uuid.uuid4()), # Unique ID for the contact itself
-            "patient_id": patient_id,
-            "contact_name": contact_details["contact_name"],
-            "relationship": contact_details["relationship"],
-            "phone_number": contact_details["phone_number"],
-            "email_address": contact_details.get("email_address", "") # Optional field
-        }
+        new_contact = self._build_contact(patient_id, form)
 
-        patient["emergency_contacts"].append(new_contact)
+        patient.emergency_contacts.append(new_contact)
         
-        patient_full_name = f"{patient['first_name']} {patient['last_name']}"
+        patient_full_name = f"{patient.first_name} {patient.last_name}"
 
         return {
             "status": "success",
             "message": f"Emergency contact for {patient_full_name} ({patient_id}) added successfully.",
             "patient_id": patient_id,
-            "contact_data": new_contact,
-            "patient_data_with_contacts": patient # For UI to update the list of contacts
+            "contact_data": new_contact.to_dict(), # For UI to append to the list of contacts
+            "emergency_contact_count": len(patient.emergency_contacts)
+        }
+
+    # --- Bulk Import: Add Several Emergency Contacts at Once ---
+    def add_emergency_contacts(self, patient_id: str, contacts_list: list) -> dict:
+        """
+        Records several emergency contacts for a registered patient in one call.
+        All contacts are validated first; if any is invalid none are saved, and the errors
+        are keyed by the contact's position in contacts_list as a string ("0", "1", ...),
+        so the response round-trips through JSON serializers unchanged. Any iterable is accepted; an
+        empty one is rejected.
+        Returns a dictionary with status, message, and either the added contacts or errors.
+        """
+        forms = [_contact_form(c) for c in contacts_list]  # Also materializes one-shot iterables
+        patient = self.get_patient(patient_id)
+        if patient is None:
+            return {
+                "status": "error",
+                "message": f"Patient with ID {patient_id} not found. Cannot add emergency contacts.",
+                "errors": {"patient_id": "Patient not found"},
+                "data": forms
+            }
+
+        if not forms:
+            return {
+                "status": "error",
+                "message": "No emergency contacts were provided.",
+                "errors": {"contacts": "At least one emergency contact is required"},
+                "data": []
+            }
+
+        validate = self._validate_emergency_contact_details
+        errors = {}
+        for i, form in enumerate(forms):
+            contact_errors = validate(form)
+            if contact_errors:
+                errors[str(i)] = contact_errors
+
+        if errors:
+            return {
+                "status": "error",
+                "message": "Failed to add emergency contacts due to missing or invalid information.",
+                "errors": errors,
+                "data": forms # For form re-population
+            }
+
+        build = self._build_contact
+        new_contacts = [build(patient_id, form) for form in forms]
+        patient.emergency_contacts.extend(new_contacts)
+
+        patient_full_name = f"{patient.first_name} {patient.last_name}"
+
+        return {
+            "status": "success",
+            "message": f"{len(new_contacts)} emergency contact(s) for {patient_full_name} ({patient_id}) added successfully.",
+            "patient_id": patient_id,
+            "added": len(new_contacts),
+            "contact_data": [contact.to_dict() for contact in new_contacts], # For UI to append to the list
+            "emergency_contact_count": len(patient.emergency_contacts)
         }
 
     # --- Public Helper: Retrieve Patient Data (useful for testing and other features) ---
-    def get_patient(self, patient_id: str) -> dict or None:
+    def get_patient(self, patient_id: str) -> Patient | None:
         """Retrieves a patient's full record by their ID."""
-        return self.patients.get(patient_id)
+        idx = self._id_to_idx.get(patient_id)
+        return None if idx is None else self._patient_records[idx]
+
+    # --- Public Helper: Retrieve a Serialized Patient View (read-heavy dashboards) ---
+    def get_patient_view(self, patient_id: str) -> bytes | None:
+        """
+        Returns a patient's full record as pre-serialized JSON bytes, or None if not found.
+        Repeat reads are served from a cache until a contact is added, whether through the
+        registry or directly on emergency_contacts; in-place edits of existing fields are not tracked.
+        """
+        patient = self.get_patient(patient_id)
+        if patient is None:
+            return None
+        return self._cached_view(patient_id, len(patient.emergency_contacts))
+
+    def _render_patient_view(self, patient_id: str, contact_count: int) -> bytes:
+        """Serializes the current record; contact_count is only part of the cache key."""
+        return json.dumps(self.get_patient(patient_id).to_dict()).encode()
 
 # --- Simulation of User Interaction and Testing (Equivalent to running automated tests) ---
 if __name__ == "__main__":
@@ -228,7 +513,7 @@ if __name__ == "__main__":
 
     saved_patient = registry.get_patient(initial_patient_id)
     assert saved_patient is not None
-    print(f"  Patient data saved to system. Full name: {saved_patient['first_name']} {saved_patient['last_name']}")
+    print(f"  Patient data saved to system. Full name: {saved_patient.first_name} {saved_patient.last_name}")
     assert result_success["clear_form"] is True
     print("  Form fields should clear (UI signal received).")
     print("  Scenario PASSED: Successful New Patient Registration")
@@ -264,7 +549,7 @@ if __name__ == "__main__":
     print("  Patient not registered in the system.")
     
     assert result_missing["data"]["first_name"] == "Jane"
-    assert "date_of_birth" not in result_missing["data"] # Missing field
+    assert result_missing["data"]["date_of_birth"] == "" # Missing field
     print("  Previously entered information retained in form data.")
     print("  Scenario PASSED: Attempt to Register Patient with Missing Required Information")
 
@@ -288,16 +573,16 @@ if __name__ == "__main__":
     print(f"  Result: {result_ec_success['message']}")
     
     updated_patient = registry.get_patient(initial_patient_id)
-    assert len(updated_patient["emergency_contacts"]) == 1
-    added_contact = updated_patient["emergency_contacts"][0]
-    print(f"  Emergency contact '{added_contact['contact_name']}' saved and associated.")
-    assert added_contact["contact_name"] == "Jane Doe"
-    assert added_contact["relationship"] == "Spouse"
-    assert added_contact["phone_number"] == "555-987-6543"
-    assert added_contact["email_address"] == "jane.doe@example.com"
+    assert len(updated_patient.emergency_contacts) == 1
+    added_contact = updated_patient.emergency_contacts[0]
+    print(f"  Emergency contact '{added_contact.contact_name}' saved and associated.")
+    assert added_contact.contact_name == "Jane Doe"
+    assert added_contact.relationship == "Spouse"
+    assert added_contact.phone_number == "555-987-6543"
+    assert added_contact.email_address == "jane.doe@example.com"
     
-    assert result_ec_success["contact_data"] == added_contact
-    assert len(result_ec_success["patient_data_with_contacts"]["emergency_contacts"]) == 1
+    assert result_ec_success["contact_data"] == added_contact.to_dict()
+    assert result_ec_success["emergency_contact_count"] == 1
     print("  New contact data returned for display in patient's list.")
     print("  Scenario PASSED: Successfully Adding a Single Emergency Contact")
 
@@ -326,14 +611,147 @@ if __name__ == "__main__":
     print(f"  Error message: '{result_ec_missing['errors']['phone_number']}'")
     assert result_ec_missing["errors"]["phone_number"] == "Phone Number is required"
 
-    current_patient_contacts = registry.get_patient(initial_patient_id)["emergency_contacts"]
+    current_patient_contacts = registry.get_patient(initial_patient_id).emergency_contacts
     assert len(current_patient_contacts) == 1 # Only Jane Doe should be there
-    assert not any(c["contact_name"] == "Alice Wonderland" for c in current_patient_contacts)
+    assert not any(c.contact_name == "Alice Wonderland" for c in current_patient_contacts)
     print("  Emergency contact not saved.")
     
     assert result_ec_missing["data"]["contact_name"] == "Alice Wonderland"
     print("  Entered contact name retained in form data.")
     print("  Scenario PASSED: Attempt to Add Emergency Contact with Missing Required Information")
 
+    # --- Bulk Import ---
+    print("\n--- Scenario: Registering a Batch of Patients from Column Data ---")
+    batch_columns = {field: [value, value] for field, value in patient_details_full.items()}
+    batch_columns["first_name"] = ["Batch", "Broken"]
+    batch_columns["admission_date"] = ["2023-10-28", "2023-02-30"]
+    batch_results = registry.register_batch(batch_columns)
+
+    assert len(batch_results) == 2
+    assert batch_results[0]["status"] == "success"
+    assert registry.get_patient(batch_results[0]["patient_id"]).first_name == "Batch"
+    assert batch_results[1]["status"] == "error"
+    assert batch_results[1]["errors"]["admission_date"] == "Admission Date must be in YYYY-MM-DD format"
+
+    batch_columns["notes"] = ["Row note", "", "Longer non-patient column"] # Ignored, adds no rows
+    assert len(registry.register_batch(batch_columns)) == 2
+    batch_columns["city"] = ["Anytown"] # Ragged patient column
+    try:
+        registry.register_batch(batch_columns)
+        raise AssertionError("Ragged columns should be rejected")
+    except ValueError:
+        pass
+
+    nan_columns = {field: [value, value] for field, value in patient_details_full.items()}
+    nan_columns["city"] = [float("nan"), "Anytown"] # pandas fills blank cells with NaN or None
+    nan_columns["date_of_birth"] = ["1990-05-15", None]
+    nan_results = registry.register_batch(nan_columns)
+    assert nan_results[0]["errors"] == {"city": "City is required"}
+    assert nan_results[1]["errors"] == {"date_of_birth": "Date of Birth is required"}
+    print("  Valid row registered, invalid row rejected with field errors.")
+    print("  Scenario PASSED: Registering a Batch of Patients from Column Data")
+
+    print("\n--- Scenario: Registering from String-Subclass Values (e.g. numpy.str_) ---")
+    class FormStr(str): # Stands in for numpy.str_ and other str subclasses from import tools
+        pass
+    subclass_columns = {field: [FormStr(value)] for field, value in patient_details_full.items()}
+    subclass_result = registry.register_batch(subclass_columns)[0]
+    assert subclass_result["status"] == "success"
+    subclass_patient = registry.get_patient(subclass_result["patient_id"])
+    assert type(subclass_patient.gender) is str and type(subclass_patient.state) is str # Interned as plain str
+    subclass_contact = {k: FormStr(v) for k, v in emergency_contact_full.items()}
+    result_subclass_contact = registry.add_emergency_contact(subclass_result["patient_id"], subclass_contact)
+    assert result_subclass_contact["status"] == "success"
+    assert type(subclass_patient.emergency_contacts[0].relationship) is str
+    print("  Patient and contact stored with plain str values.")
+    print("  Scenario PASSED: Registering from String-Subclass Values (e.g. numpy.str_)")
+
+    print("\n--- Scenario: Registering with Non-String Values ---")
+    typed_details = {**patient_details_full, "date_of_birth": datetime.date(1990, 5, 15), "zip_code": 12345}
+    result_typed = registry.register_new_patient(typed_details)
+    assert result_typed["status"] == "success"
+    assert result_typed["patient_data"]["date_of_birth"] == "1990-05-15" and result_typed["patient_data"]["zip_code"] == "12345"
+    result_typed_invalid = registry.register_new_patient({**typed_details, "gender": 7})
+    assert result_typed_invalid["errors"] == {"gender": "Invalid gender. Must be Male, Female, Other, or Prefer not to say."}
+    assert json.loads(json.dumps(result_typed_invalid))["data"]["date_of_birth"] == "1990-05-15" # Echo is JSON-ready
+    print("  Dates and numbers stored as strings; error echo serializes without a custom encoder.")
+    print("  Scenario PASSED: Registering with Non-String Values")
+
+    print("\n--- Scenario: Registering with Extra Non-Form Keys ---")
+    class NoTruthValue: # e.g. a numpy array or pd.NA attached by an import tool
+        def __bool__(self):
+            raise TypeError("truth value is ambiguous")
+    result_extra = registry.register_new_patient({**patient_details_full, "attachment": NoTruthValue()})
+    assert result_extra["status"] == "success"
+    assert "attachment" not in result_extra["patient_data"]
+    print("  Extra keys ignored by validation and not stored.")
+    print("  Scenario PASSED: Registering with Extra Non-Form Keys")
+
+    print("\n--- Scenario: Browsing All Registered Patients ---")
+    all_patients = registry.patients
+    assert initial_patient_id in all_patients and "P-9999-9999" not in all_patients
+    assert all_patients[initial_patient_id] is registry.get_patient(initial_patient_id)
+    assert list(all_patients)[0] == initial_patient_id # Registration order
+    patient_count = len(all_patients)
+    late_patient_id = registry.register_new_patient(patient_details_full)["patient_id"]
+    assert len(all_patients) == patient_count + 1 and late_patient_id in all_patients # Live view
+    try:
+        all_patients["P-0000-0000"] = saved_patient
+        raise AssertionError("patients mapping should be read-only")
+    except TypeError:
+        pass
+    print("  All patients listed in registration order; the mapping is live and read-only.")
+    print("  Scenario PASSED: Browsing All Registered Patients")
+
+    print("\n--- Scenario: Adding Many Emergency Contacts to One Patient ---")
+    busy_registry = HospitalRegistry()
+    busy_patient_id = busy_registry.register_new_patient(patient_details_full)["patient_id"]
+    for _ in range(3000):
+        result_busy = busy_registry.add_emergency_contact(busy_patient_id, emergency_contact_full)
+    assert result_busy["status"] == "success"
+    assert result_busy["emergency_contact_count"] == 3000
+    assert "patient_data_with_contacts" not in result_busy # Adds don't echo the whole, growing contact list
+    busy_patient = busy_registry.get_patient(busy_patient_id)
+    assert len(busy_patient.to_dict()["emergency_contacts"]) == 3000
+
+    result_busy["contact_data"]["contact_name"] = "Edited in response" # Responses are copies, not stored state
+    assert busy_patient.emergency_contacts[-1].contact_name == "Jane Doe"
+    assert busy_patient.to_dict()["emergency_contacts"][-1]["contact_name"] == "Jane Doe"
+    print("  3000 contacts stored; each response carried only the new contact.")
+    print("  Scenario PASSED: Adding Many Emergency Contacts to One Patient")
+
+    print("\n--- Scenario: Adding Several Emergency Contacts at Once ---")
+    batch_contacts = [
+        {"contact_name": "Bob Doe", "relationship": "Brother", "phone_number": "555-222-3333"},
+        {"contact_name": "Carol Doe", "relationship": "Sister", "phone_number": "555-444-5555"},
+    ]
+    result_bulk_invalid = registry.add_emergency_contacts(initial_patient_id, batch_contacts + [{"contact_name": "No Phone"}])
+    assert result_bulk_invalid["status"] == "error"
+    assert json.loads(json.dumps(result_bulk_invalid))["errors"] == result_bulk_invalid["errors"] # str keys survive JSON
+    assert result_bulk_invalid["errors"]["2"]["phone_number"] == "Phone Number is required"
+    assert len(registry.get_patient(initial_patient_id).emergency_contacts) == 1 # Nothing saved
+
+    assert len(json.loads(registry.get_patient_view(initial_patient_id))["emergency_contacts"]) == 1 # Cached before the write
+    assert registry.add_emergency_contacts(initial_patient_id, [])["status"] == "error"
+    result_bulk = registry.add_emergency_contacts(initial_patient_id, iter(batch_contacts)) # One-shot iterables work
+    assert result_bulk["status"] == "success"
+    assert result_bulk["added"] == 2
+    assert [c.contact_name for c in registry.get_patient(initial_patient_id).emergency_contacts] == ["Jane Doe", "Bob Doe", "Carol Doe"]
+    assert len(json.loads(registry.get_patient_view(initial_patient_id))["emergency_contacts"]) == 3 # Cached view refreshed
+    print("  Invalid batch rejected as a whole; valid batch saved in order.")
+    print("  Scenario PASSED: Adding Several Emergency Contacts at Once")
+
+    print("\n--- Scenario: Reading the Cached Patient View ---")
+    view_registry = HospitalRegistry()
+    view_patient_id = view_registry.register_new_patient(patient_details_full)["patient_id"]
+    assert json.loads(view_registry.get_patient_view(view_patient_id))["emergency_contacts"] == []
+    view_registry.add_emergency_contact(view_patient_id, emergency_contact_full)
+    view_patient = view_registry.get_patient(view_patient_id)
+    view_patient.emergency_contacts.append(view_patient.emergency_contacts[0]) # Direct append bypassing the registry
+    assert len(json.loads(view_registry.get_patient_view(view_patient_id))["emergency_contacts"]) == 2
+    assert view_registry.get_patient_view("P-9999-9999") is None
+    print("  Cached view refreshed after each contact add, including direct appends.")
+    print("  Scenario PASSED: Reading the Cached Patient View")
+
     print("\n--- All Simulated Scenarios Completed ---")
 ```
\ No newline at end of file